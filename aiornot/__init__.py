@@ -1,2 +1,21 @@
-from aiornot.sync_client import Client  # noqa
-from aiornot.async_client import AsyncClient  # noqa
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiornot.sync_client import Client
+    from aiornot.async_client import AsyncClient
+
+__all__ = ["AsyncClient", "Client"]
+
+
+def __getattr__(name: str) -> Any:
+    # Clients are imported on first access so the CLI doesn't pay for
+    # httpx and pydantic on `--help`.
+    if name == "Client":
+        from aiornot.sync_client import Client
+
+        return Client
+    if name == "AsyncClient":
+        from aiornot.async_client import AsyncClient
+
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
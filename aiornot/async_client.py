@@ -4,6 +4,7 @@ from aiornot.req_builders import (
     classify_image_blob_args,
     classify_image_url_args,
     is_live_args,
+    token_args,
 )
 from aiornot.resp_types import (
     AudioResp,
@@ -34,6 +35,7 @@ class AsyncClient:
         if not self._api_key:
             raise RuntimeError(API_KEY_ERR)
         self._base_url = base_url or BASE_URL
+        self._authorization = f"Bearer {self._api_key}"
         self._client = client or _SHARED_CLIENT
 
     async def is_live(self) -> bool:
@@ -41,12 +43,14 @@ class AsyncClient:
 
     async def image_report_by_url(self, url: str) -> ImageResp:
         return cc.image_report(
-            await self._client.post(**classify_image_url_args(url, self._api_key))
+            await self._client.post(**classify_image_url_args(url, self._authorization))
         )
 
     async def image_report_by_blob(self, data: bytes) -> ImageResp:
         return cc.image_report(
-            await self._client.post(**classify_image_blob_args(data, self._api_key))
+            await self._client.post(
+                **classify_image_blob_args(data, self._authorization)
+            )
         )
 
     async def image_report_by_file(self, file_path: Union[str, Path]) -> ImageResp:
@@ -55,12 +59,14 @@ class AsyncClient:
 
     async def audio_report_by_url(self, url: str) -> AudioResp:
         return cc.audio_report(
-            await self._client.post(**classify_audio_url_args(url, self._api_key))
+            await self._client.post(**classify_audio_url_args(url, self._authorization))
         )
 
     async def audio_report_by_blob(self, data: bytes) -> AudioResp:
         return cc.audio_report(
-            await self._client.post(**classify_audio_blob_args(data, self._api_key))
+            await self._client.post(
+                **classify_audio_blob_args(data, self._authorization)
+            )
         )
 
     async def audio_report_by_file(self, file_path: Union[str, Path]) -> AudioResp:
@@ -68,34 +74,14 @@ class AsyncClient:
             return await self.audio_report_by_blob(await f.read())
 
     async def check_token(self) -> CheckTokenResp:
-        return cc.check_token(
-            await self._client.get(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
-        )
+        return cc.check_token(await self._client.get(**token_args(self._authorization)))
 
     async def refresh_token(self) -> RefreshTokenResp:
         return cc.refresh_token(
-            await self._client.put(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
+            await self._client.put(**token_args(self._authorization))
         )
 
     async def revoke_token(self) -> RevokeTokenResp:
         return cc.revoke_token(
-            await self._client.delete(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
+            await self._client.delete(**token_args(self._authorization))
         )
@@ -1,11 +1,14 @@
+import functools
 import os
 import json
 import click
 import sys
 from pathlib import Path
-from aiornot.sync_client import Client
-from pydantic import BaseModel
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from aiornot.sync_client import Client
+    from pydantic import BaseModel
 
 
 @click.group()
@@ -34,15 +37,8 @@ def image(source):
 
     Note: Only premium users get confidence scores.
     """
-    client = Client(_load_api_key())
-    if source.startswith("http"):
-        _print_model_as_json(client.image_report_by_url(source))
-    else:
-        path = Path(source)
-        if not path.exists():
-            click.echo(f"File {source} does not exist.")
-            sys.exit(1)
-        _print_model_as_json(client.image_report_by_file(path))
+    client = _get_client()
+    _report(source, client.image_report_by_url, client.image_report_by_file)
 
 
 @cli.command()
@@ -53,15 +49,8 @@ def audio(source):
 
     Note: Only premium users get confidence scores.
     """
-    client = Client(api_key=_load_api_key())
-    if source.startswith("http"):
-        _print_model_as_json(client.audio_report_by_url(source))
-    else:
-        path = Path(source)
-        if not path.exists():
-            click.echo(f"File {source} does not exist.")
-            sys.exit(1)
-        _print_model_as_json(client.audio_report_by_file(path))
+    client = _get_client()
+    _report(source, client.audio_report_by_url, client.audio_report_by_file)
 
 
 @token.command()
@@ -69,7 +58,7 @@ def check():
     """
     Check if your API token is valid.
     """
-    _print_model_as_json(Client(api_key=_load_api_key()).check_token())
+    _print_model_as_json(_get_client().check_token())
 
 
 @token.command()
@@ -79,7 +68,7 @@ def revoke():
     """
     # TODO: delete config file
     click.confirm("Are you sure you want to revoke your API token?", abort=True)
-    _print_model_as_json(Client(api_key=_load_api_key()).revoke_token())
+    _print_model_as_json(_get_client().revoke_token())
 
 
 @token.command()
@@ -87,6 +76,8 @@ def refresh():
     """
     Refresh your API token.
     """
+    from aiornot.sync_client import Client
+
     # TODO: save new token to config file
     client = Client()
     _print_model_as_json(client.refresh_token())
@@ -97,6 +88,8 @@ def config():
     """
     Save your API token
     """
+    from aiornot.sync_client import Client
+
     click.echo("Go to https://aiornot.com/dashboard/api to get an API key.")
 
     while True:
@@ -110,6 +103,13 @@ def config():
     _save_api_key(api_key)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client() -> "Client":
+    from aiornot.sync_client import Client
+
+    return Client(api_key=_load_api_key())
+
+
 def _load_api_key() -> Optional[str]:
     token = os.getenv("AIORNOT_API_TOKEN")
     if token is not None:
@@ -143,7 +143,23 @@ def _save_api_key(api_key: str) -> None:
             click.echo("API Key saved to ~/.aiornot/config.json")
 
 
-def _print_model_as_json(model: BaseModel) -> None:
+def _report(
+    source: str,
+    by_url: Callable[[str], "BaseModel"],
+    by_file: Callable[[Path], "BaseModel"],
+) -> None:
+    if source.startswith("http"):
+        _print_model_as_json(by_url(source))
+        return
+
+    path = Path(source)
+    if not path.exists():
+        click.echo(f"File {source} does not exist.")
+        sys.exit(1)
+    _print_model_as_json(by_file(path))
+
+
+def _print_model_as_json(model: "BaseModel") -> None:
     click.echo(model.model_dump_json(indent=4))
 
 
@@ -15,12 +15,12 @@ def is_live(resp: httpx.Response) -> bool:
 
 def image_report(resp: httpx.Response) -> ImageResp:
     resp.raise_for_status()
-    return ImageResp(**resp.json())
+    return ImageResp.model_validate_json(resp.content)
 
 
 def audio_report(resp: httpx.Response) -> AudioResp:
     resp.raise_for_status()
-    return AudioResp(**resp.json())
+    return AudioResp.model_validate_json(resp.content)
 
 
 def check_token(resp: httpx.Response) -> CheckTokenResp:
@@ -28,14 +28,14 @@ def check_token(resp: httpx.Response) -> CheckTokenResp:
         return CheckTokenResp(is_valid=False)
     else:
         resp.raise_for_status()
-    return CheckTokenResp(**resp.json())
+    return CheckTokenResp.model_validate_json(resp.content)
 
 
 def refresh_token(resp: httpx.Response) -> RefreshTokenResp:
     resp.raise_for_status()
-    return RefreshTokenResp(**resp.json())
+    return RefreshTokenResp.model_validate_json(resp.content)
 
 
 def revoke_token(resp: httpx.Response) -> RevokeTokenResp:
     resp.raise_for_status()
-    return RevokeTokenResp(**resp.json())
+    return RevokeTokenResp.model_validate_json(resp.content)
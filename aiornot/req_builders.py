@@ -1,65 +1,87 @@
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+import httpx
 from aiornot.settings import BASE_URL
 
 _THREE_MINUTES = 180
+# Parsed once so httpx doesn't re-parse the URL string on every request.
+_IMAGE_REPORT_URL = httpx.URL(f"{BASE_URL}/reports/image")
+_AUDIO_REPORT_URL = httpx.URL(f"{BASE_URL}/reports/audio")
+_TOKENS_URL = httpx.URL(f"{BASE_URL}/credentials/tokens")
 
 
-def is_live_args(base_url: str, timeout: int = 5) -> dict[str, Any]:
+@lru_cache(maxsize=4)
+def _auth_headers(authorization: str) -> Mapping[str, str]:
+    return MappingProxyType({"Authorization": authorization})
+
+
+@lru_cache(maxsize=4)
+def _json_auth_headers(authorization: str) -> Mapping[str, str]:
+    return MappingProxyType(
+        {**_auth_headers(authorization), "Content-Type": "application/json"}
+    )
+
+
+@lru_cache(maxsize=32)
+def is_live_args(base_url: str, timeout: int = 5) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            "url": httpx.URL(f"{base_url}/system/live"),
+            "timeout": timeout,
+        }
+    )
+
+
+def token_args(authorization: str, timeout: int = 10) -> dict[str, Any]:
     return {
-        "url": f"{base_url}/system/live",
+        "url": _TOKENS_URL,
+        "headers": _auth_headers(authorization),
         "timeout": timeout,
     }
 
 
-def classify_image_url_args(
-    url: str, api_key: str, timeout: int = _THREE_MINUTES
+def _url_args(
+    endpoint: httpx.URL, url: str, authorization: str, timeout: int
 ) -> dict[str, Any]:
     return {
-        "url": f"{BASE_URL}/reports/image",
-        "headers": {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
+        "url": endpoint,
+        "headers": _json_auth_headers(authorization),
         "json": {"object": str(url)},
         "timeout": timeout,
     }
 
 
-def classify_image_blob_args(
-    data: bytes, api_key: str, timeout: int = _THREE_MINUTES
+def _blob_args(
+    endpoint: httpx.URL, data: bytes, authorization: str, timeout: int
 ) -> dict[str, Any]:
     return {
-        "url": f"{BASE_URL}/reports/image",
-        "headers": {
-            "Authorization": f"Bearer {api_key}",
-        },
-        "files": {"object": data},
+        "url": endpoint,
+        "headers": _auth_headers(authorization),
+        "files": (("object", data),),
         "timeout": timeout,
     }
 
 
+def classify_image_url_args(
+    url: str, authorization: str, timeout: int = _THREE_MINUTES
+) -> dict[str, Any]:
+    return _url_args(_IMAGE_REPORT_URL, url, authorization, timeout)
+
+
+def classify_image_blob_args(
+    data: bytes, authorization: str, timeout: int = _THREE_MINUTES
+) -> dict[str, Any]:
+    return _blob_args(_IMAGE_REPORT_URL, data, authorization, timeout)
+
+
 def classify_audio_url_args(
-    url: str, api_key: str, timeout: int = _THREE_MINUTES
+    url: str, authorization: str, timeout: int = _THREE_MINUTES
 ) -> dict[str, Any]:
-    return {
-        "url": f"{BASE_URL}/reports/audio",
-        "headers": {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        "json": {"object": str(url)},
-        "timeout": timeout,
-    }
+    return _url_args(_AUDIO_REPORT_URL, url, authorization, timeout)
 
 
 def classify_audio_blob_args(
-    data: bytes, api_key: str, timeout: int = _THREE_MINUTES
+    data: bytes, authorization: str, timeout: int = _THREE_MINUTES
 ) -> dict[str, Any]:
-    return {
-        "url": f"{BASE_URL}/reports/audio",
-        "headers": {
-            "Authorization": f"Bearer {api_key}",
-        },
-        "files": {"object": data},
-        "timeout": timeout,
-    }
+    return _blob_args(_AUDIO_REPORT_URL, data, authorization, timeout)
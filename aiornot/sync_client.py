@@ -7,6 +7,7 @@ from aiornot.req_builders import (
     classify_image_blob_args,
     classify_image_url_args,
     is_live_args,
+    token_args,
 )
 from aiornot.resp_types import (
     AudioResp,
@@ -19,6 +20,9 @@ import aiornot.common_client as cc
 from aiornot.settings import API_KEY_ERR, BASE_URL, API_KEY
 
 
+_SHARED_CLIENT = httpx.Client()
+
+
 class Client:
     def __init__(
         self,
@@ -29,22 +33,21 @@ class Client:
         self._api_key = cast(str, api_key or API_KEY)
         if not self._api_key:
             raise RuntimeError(API_KEY_ERR)
-
-        self._api_key = api_key or API_KEY
-        self._client = client or httpx
+        self._client = client or _SHARED_CLIENT
         self._base_url = base_url or BASE_URL
+        self._authorization = f"Bearer {self._api_key}"
 
     def is_live(self) -> bool:
         return cc.is_live(self._client.get(**is_live_args(self._base_url)))
 
     def image_report_by_url(self, url: str) -> ImageResp:
         return cc.image_report(
-            self._client.post(**classify_image_url_args(url, self._api_key))
+            self._client.post(**classify_image_url_args(url, self._authorization))
         )
 
     def image_report_by_blob(self, data: bytes) -> ImageResp:
         return cc.image_report(
-            self._client.post(**classify_image_blob_args(data, self._api_key))
+            self._client.post(**classify_image_blob_args(data, self._authorization))
         )
 
     def image_report_by_file(self, file_path: Union[str, Path]) -> ImageResp:
@@ -53,12 +56,12 @@ class Client:
 
     def audio_report_by_url(self, url: str) -> AudioResp:
         return cc.audio_report(
-            self._client.post(**classify_audio_url_args(url, self._api_key))
+            self._client.post(**classify_audio_url_args(url, self._authorization))
         )
 
     def audio_report_by_blob(self, data: bytes) -> AudioResp:
         return cc.audio_report(
-            self._client.post(**classify_audio_blob_args(data, self._api_key))
+            self._client.post(**classify_audio_blob_args(data, self._authorization))
         )
 
     def audio_report_by_file(self, file_path: Union[str, Path]) -> AudioResp:
@@ -66,34 +69,10 @@ class Client:
             return self.audio_report_by_blob(f.read())
 
     def check_token(self) -> CheckTokenResp:
-        return cc.check_token(
-            self._client.get(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
-        )
+        return cc.check_token(self._client.get(**token_args(self._authorization)))
 
     def refresh_token(self) -> RefreshTokenResp:
-        return cc.refresh_token(
-            self._client.put(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
-        )
+        return cc.refresh_token(self._client.put(**token_args(self._authorization)))
 
     def revoke_token(self) -> RevokeTokenResp:
-        return cc.revoke_token(
-            self._client.delete(
-                f"{BASE_URL}/credentials/tokens",
-                timeout=10,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                },
-            )
-        )
+        return cc.revoke_token(self._client.delete(**token_args(self._authorization)))
@@ -1,23 +1,148 @@
-from aiornot import Client, AsyncClient
+from aiornot import Client, AsyncClient, async_client, sync_client
+from aiornot.settings import BASE_URL
+import asyncio
+import httpx
 import inspect
+import json
+import pytest
 
+_IMAGE_BODY = {
+    "id": "b2beb42b-9ef7-4d65-b52f-ac4d5b05e772",
+    "created_at": "2023-11-28T20:06:30.130964Z",
+    "report": {
+        "verdict": "ai",
+        "ai": {"is_detected": True},
+        "human": {"is_detected": False},
+    },
+    "facets": {},
+}
+_AUDIO_BODY = {
+    "id": "c3d4e5f6-9ef7-4d65-b52f-ac4d5b05e772",
+    "created_at": "2023-11-28T20:06:30.130964Z",
+    "report": {"verdict": "human"},
+}
+_TOKEN_BODY = {"is_valid": True, "token": "new-key", "is_revoked": True}
 
-def test_matching_signatures():
-    sync_methods = [
-        func
-        for func in dir(Client)
-        if callable(getattr(Client, func)) and not func.startswith("_")
-    ]
-    async_methods = [
-        func
-        for func in dir(AsyncClient)
-        if callable(getattr(AsyncClient, func)) and not func.startswith("_")
-    ]
-
-    assert set(sync_methods) == set(async_methods)
-
-    # For each method, check that the signatures match
-    for method in sync_methods:
-        sync_sig = inspect.signature(getattr(Client, method))
-        async_sig = inspect.signature(getattr(AsyncClient, method))
-        assert sync_sig == async_sig
+
+def _public_signatures(cls):
+    return {
+        name: inspect.signature(getattr(cls, name))
+        for name in dir(cls)
+        if callable(getattr(cls, name)) and not name.startswith("_")
+    }
+
+
+_SYNC = _public_signatures(Client)
+_ASYNC = _public_signatures(AsyncClient)
+
+
+def test_matching_public_methods():
+    assert set(_SYNC) == set(_ASYNC)
+
+
+@pytest.mark.parametrize("method", sorted(_SYNC))
+def test_matching_signatures(method):
+    assert _SYNC[method] == _ASYNC[method]
+
+
+@pytest.mark.parametrize("client_cls", [Client, AsyncClient])
+def test_missing_api_key_raises(monkeypatch, client_cls):
+    # API_KEY is read from the environment at import time, so patch the
+    # module constants rather than the environment.
+    monkeypatch.setattr(sync_client, "API_KEY", None)
+    monkeypatch.setattr(async_client, "API_KEY", None)
+
+    with pytest.raises(RuntimeError):
+        client_cls()
+
+
+def _handler(requests):
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/reports/image"):
+            return httpx.Response(200, json=_IMAGE_BODY)
+        if request.url.path.endswith("/reports/audio"):
+            return httpx.Response(200, json=_AUDIO_BODY)
+        return httpx.Response(200, json=_TOKEN_BODY)
+
+    return handle
+
+
+@pytest.fixture(params=["sync", "async"])
+def recording_client(request):
+    """
+    Yields (call, requests): call(method, *args) runs the named client method
+    against a MockTransport and requests collects what was sent.
+    """
+    requests: list[httpx.Request] = []
+    transport = httpx.MockTransport(_handler(requests))
+
+    if request.param == "sync":
+        with httpx.Client(transport=transport) as http:
+            client = Client(api_key="test-key", client=http)
+            yield (lambda method, *args: getattr(client, method)(*args)), requests
+        return
+
+    http = httpx.AsyncClient(transport=transport)
+    aclient = AsyncClient(api_key="test-key", client=http)
+
+    def call(method, *args):
+        return asyncio.run(getattr(aclient, method)(*args))
+
+    try:
+        yield call, requests
+    finally:
+        asyncio.run(http.aclose())
+
+
+@pytest.mark.parametrize(
+    "method,endpoint",
+    [
+        ("image_report_by_url", "/reports/image"),
+        ("audio_report_by_url", "/reports/audio"),
+    ],
+)
+def test_report_by_url_request(recording_client, method, endpoint):
+    call, requests = recording_client
+    call(method, "https://example.com/sample")
+
+    (request,) = requests
+    assert request.method == "POST"
+    assert str(request.url) == f"{BASE_URL}{endpoint}"
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"object": "https://example.com/sample"}
+
+
+@pytest.mark.parametrize(
+    "method,endpoint",
+    [
+        ("image_report_by_blob", "/reports/image"),
+        ("audio_report_by_blob", "/reports/audio"),
+    ],
+)
+def test_report_by_blob_request(recording_client, method, endpoint):
+    call, requests = recording_client
+    call(method, b"sample-bytes")
+
+    (request,) = requests
+    assert request.method == "POST"
+    assert str(request.url) == f"{BASE_URL}{endpoint}"
+    assert request.headers["Authorization"] == "Bearer test-key"
+    assert request.headers["Content-Type"].startswith("multipart/form-data")
+    assert b'name="object"' in request.content
+    assert b"sample-bytes" in request.content
+
+
+@pytest.mark.parametrize(
+    "method,verb",
+    [("check_token", "GET"), ("refresh_token", "PUT"), ("revoke_token", "DELETE")],
+)
+def test_token_request(recording_client, method, verb):
+    call, requests = recording_client
+    call(method)
+
+    (request,) = requests
+    assert request.method == verb
+    assert str(request.url) == f"{BASE_URL}/credentials/tokens"
+    assert request.headers["Authorization"] == "Bearer test-key"
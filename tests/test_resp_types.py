@@ -16,7 +16,7 @@ def test_image_free():
         },
     }
 
-    resp = ImageResp(**data)
+    resp = ImageResp.model_validate(data)
     assert resp.is_ai()
 
 
@@ -50,10 +50,10 @@ def test_image_premium():
         "created_at": "2023-11-17T02:27:03.430897Z",
     }
 
-    resp = ImageResp(**data)
+    resp = ImageResp.model_validate(data)
     assert resp.is_ai()
 
     # add an extra field
     data["foo"] = "bar"
-    resp = ImageResp(**data)
+    resp = ImageResp.model_validate(data)
     assert resp.is_ai()